@@ -1,14 +1,22 @@
 """Bot Configuration"""
 
 import os
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Bot Configuration
+# Bot Configuration - read the environment once here; submodules import
+# these constants instead of re-querying os.environ
 DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+# The keep-alive HTTP server only exists to stop free-tier hosts from
+# suspending the process; hosts with a native always-on option can turn
+# it off entirely
+KEEPALIVE_ENABLED = os.getenv("KEEPALIVE_ENABLED", "1") not in ("0", "false", "no")
 
 # Active Developer Badge Configuration
 CHANNEL_ID = 1410176690663067730  # Replace with your Discord channel ID
@@ -52,6 +60,29 @@ COMPTIA_CERTS = {
     }
 }
 
+# Words too generic to identify a domain on their own
+_DOMAIN_STOPWORDS = frozenset({"and", "of", "the", "in"})
+
+# Precompute strings derived from the immutable cert data so commands do
+# an O(1) lookup instead of re-joining the same lists per call
+for _cert in COMPTIA_CERTS.values():
+    _cert['domains'] = tuple(_cert['domains'])
+    _cert['domains_joined'] = ", ".join(_cert['domains'])
+    _cert['domains_bullets'] = "\n".join(f"• {d}" for d in _cert['domains'])
+    _cert['domains_set'] = frozenset(_cert['domains'])
+    # Per-domain keyword sets for the local topic matcher: lowercased
+    # and stopword-filtered once here instead of on every cache miss
+    _cert['domain_keywords'] = tuple(
+        (_domain, frozenset(_w for _w in _domain.lower().split()
+                            if _w not in _DOMAIN_STOPWORDS))
+        for _domain in _cert['domains'])
+
+# Freeze the whole structure: commands only ever read it, and a read-only
+# view catches accidental mutation without changing the dict-style access
+# used throughout the codebase
+COMPTIA_CERTS = MappingProxyType(
+    {_code: MappingProxyType(_data) for _code, _data in COMPTIA_CERTS.items()})
+
 # Cybersecurity Quotes
 CYBER_QUOTES = [
     "Cybersecurity is not a product, but a process. – Bruce Schneier",
@@ -71,6 +102,6 @@ def validate_question_count(count, max_allowed=5):
         return max_allowed
     return count
 
-def format_study_domains_list(domains):
-    """Format domains list for display"""
-    return '\n'.join([f"• {domain}" for domain in domains])
\ No newline at end of file
+def format_study_domains_list(certification):
+    """Get the precomputed bullet list of domains for a certification"""
+    return COMPTIA_CERTS[certification]['domains_bullets']
\ No newline at end of file
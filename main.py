@@ -1,63 +1,162 @@
 """Main CompTIA Study Bot Runner"""
 
-from flask import Flask
-from threading import Thread
+import asyncio
+import json
+from datetime import datetime, timezone
+
+import uvicorn
+
 from src.bot import bot
-from config import DISCORD_TOKEN
-
-# Flask keep-alive server
-app = Flask('')
-
-@app.route('/')
-def home():
-    return "CompTIA Study Bot is running!"
-
-@app.route('/health')
-def health():
-    """Health check endpoint for monitoring services"""
-    from flask import jsonify
-    return jsonify({
-        "status": "online", 
-        "bot": "CompTIA Study Bot",
-        "message": "All systems operational",
-        "timestamp": "2025-09-04T05:42:00Z"
-    })
+from src.database.models import get_database_connection, release_database_connection
+from src.utils.logger import get_logger
+from config import DISCORD_TOKEN, KEEPALIVE_ENABLED
 
-@app.route('/status')
-def status():
-    """Detailed status endpoint"""
-    return """
+log = get_logger(__name__)
+
+STATUS_HTML = """
     <html>
     <head><title>CompTIA Study Bot Status</title></head>
     <body>
         <h1>🤖 CompTIA Study Bot</h1>
         <p><strong>Status:</strong> ✅ Online</p>
-        <p><strong>Services:</strong> Discord Bot, Web Server</p>
-        <p><strong>Commands:</strong> 17 Active</p>
-        <p><strong>Database:</strong> ✅ Connected</p>
+        <p><strong>Services:</strong> Web Server</p>
+        <p><strong>Discord:</strong> {discord_status}</p>
+        <p><strong>Database:</strong> {database_status}</p>
     </body>
     </html>
     """
 
-def run():
-    app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False, threaded=True)
+# Per-check deadline for /status so one flaky dependency can't stall a probe
+_STATUS_CHECK_TIMEOUT = 0.5
+
+async def _check_database():
+    """Verify the database answers a SELECT 1"""
+    def _ping():
+        conn = get_database_connection()
+        if not conn:
+            return False
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
+            release_database_connection(conn)
+            return True
+        except Exception:
+            release_database_connection(conn)
+            return False
+    return await asyncio.to_thread(_ping)
+
+async def _check_discord():
+    """Verify the bot is connected to the Discord gateway"""
+    return bot.is_ready()
 
-def keep_alive():
-    """Start the keep-alive server in a separate thread"""
-    t = Thread(target=run)
-    t.start()
+async def _render_status_page():
+    """Run all component checks concurrently under one deadline"""
+    discord_ok, database_ok = await asyncio.gather(
+        asyncio.wait_for(_check_discord(), timeout=_STATUS_CHECK_TIMEOUT),
+        asyncio.wait_for(_check_database(), timeout=_STATUS_CHECK_TIMEOUT),
+        return_exceptions=True)
+
+    def _badge(result):
+        return "✅ Connected" if result is True else "❌ Unavailable"
+
+    return STATUS_HTML.format(discord_status=_badge(discord_ok),
+                              database_status=_badge(database_ok))
+
+# Probe responses are pre-serialized once at import so each uptime ping
+# costs two sends and no JSON encoding
+_HEALTH_BODY = json.dumps({
+    "status": "online",
+    "bot": "CompTIA Study Bot",
+    "message": "All systems operational",
+    "started_at": datetime.now(timezone.utc).isoformat()
+}).encode()
+_ROOT_BODY = b"CompTIA Study Bot is running!"
+
+def _precomputed_response(body, content_type):
+    start = {
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [
+            (b"content-type", content_type),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    }
+    return start, {"type": "http.response.body", "body": body}
+
+_PROBE_RESPONSES = {
+    "/health": _precomputed_response(_HEALTH_BODY, b"application/json"),
+    "/": _precomputed_response(_ROOT_BODY, b"text/plain; charset=utf-8"),
+}
+
+async def app(scope, receive, send):
+    """Minimal ASGI keep-alive app serving /, /health and /status"""
+    if scope["type"] != "http":
+        return
+
+    path = scope["path"]
+
+    # Fast path: the high-frequency probe endpoints are fully precomputed
+    probe = _PROBE_RESPONSES.get(path)
+    if probe is not None:
+        await send(probe[0])
+        await send(probe[1])
+        return
+
+    status = 200
+
+    if path == "/status":
+        # Detailed status endpoint - checks run concurrently, so latency
+        # is max(checks) rather than sum(checks)
+        body = (await _render_status_page()).encode()
+        content_type = b"text/html; charset=utf-8"
+    else:
+        status = 404
+        body = b"Not Found"
+        content_type = b"text/plain; charset=utf-8"
+
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", content_type),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+async def run_bot_and_keepalive():
+    """Run the Discord bot and the keep-alive server on one event loop"""
+    server = None
+    web_task = None
+    if KEEPALIVE_ENABLED:
+        server = uvicorn.Server(
+            uvicorn.Config(app, host='0.0.0.0', port=5000, log_level='warning'))
+        web_task = asyncio.ensure_future(server.serve())
+    else:
+        log.info("🌐 Keep-alive server disabled (KEEPALIVE_ENABLED=0)")
+
+    try:
+        async with bot:
+            await bot.start(DISCORD_TOKEN)
+    finally:
+        session = getattr(bot, "http_session", None)
+        if session is not None:
+            await session.close()
+        if server is not None:
+            server.should_exit = True
+            await web_task
 
 def main():
     """Main function to run the bot"""
     if not DISCORD_TOKEN:
-        print("Error: DISCORD_TOKEN not found in environment variables")
+        log.error("❌ DISCORD_TOKEN not found in environment variables")
         return
-    
-    # Start keep-alive server
-    keep_alive()
-    
-    # Run bot
-    bot.run(DISCORD_TOKEN)
+
+    # One asyncio loop drives both the bot and the keep-alive server -
+    # no extra OS thread, no GIL handoff per probe
+    asyncio.run(run_bot_and_keepalive())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,138 +1,273 @@
 """Adaptive difficulty and weak spot analysis system"""
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-from src.database.models import get_database_connection
+import asyncio
+from psycopg2.extras import execute_values
+from ..database.models import get_database_connection, release_database_connection
+from ..utils.logger import get_logger
 from config import COMPTIA_CERTS
 
+log = get_logger(__name__)
+
+# Write-behind buffer for topic performance updates: each answer enqueues a
+# row and a background task flushes them in one batched upsert, amortizing
+# planner cost and WAL fsync across a quiz burst
+_FLUSH_INTERVAL = 0.25  # seconds to wait for more rows before flushing
+_FLUSH_MAX_ROWS = 50
+
+_QUEUE = asyncio.Queue()
+_flush_task = None
+
+# Statements are PREPAREd once per pooled connection so Postgres skips the
+# parse/plan step on every subsequent question answered
+_UPSERT_BATCH_SQL = """
+    INSERT INTO topic_performance (user_id, certification, topic, questions_attempted, questions_correct, avg_response_time)
+    VALUES %s
+    ON CONFLICT (user_id, certification, topic)
+    DO UPDATE SET
+        questions_attempted = topic_performance.questions_attempted + EXCLUDED.questions_attempted,
+        questions_correct = topic_performance.questions_correct + EXCLUDED.questions_correct,
+        avg_response_time = (topic_performance.avg_response_time * topic_performance.questions_attempted
+                             + EXCLUDED.avg_response_time * EXCLUDED.questions_attempted)
+                            / (topic_performance.questions_attempted + EXCLUDED.questions_attempted),
+        last_practiced = CURRENT_TIMESTAMP,
+        mastery_level = CASE
+            WHEN topic_performance.questions_attempted + EXCLUDED.questions_attempted >= 5 THEN
+                (topic_performance.questions_correct + EXCLUDED.questions_correct) / CAST(topic_performance.questions_attempted + EXCLUDED.questions_attempted AS DECIMAL)
+            ELSE topic_performance.mastery_level
+        END,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_PREPARE_STATEMENTS = """
+    PREPARE adaptive_get_difficulty (bigint, varchar, varchar) AS
+        SELECT questions_attempted, questions_correct, mastery_level, current_difficulty
+        FROM topic_performance
+        WHERE user_id = $1 AND certification = $2 AND topic = $3;
+    PREPARE adaptive_weak_spots (bigint, varchar, int) AS
+        SELECT topic, questions_attempted, questions_correct, mastery_level,
+               ROUND(CAST((questions_correct * 100.0 / questions_attempted) AS NUMERIC), 1) as accuracy
+        FROM topic_performance
+        WHERE user_id = $1 AND certification = $2 AND questions_attempted >= 3
+        ORDER BY mastery_level ASC, accuracy ASC
+        LIMIT $3;
+    PREPARE adaptive_strengths (bigint, varchar, int) AS
+        SELECT topic, questions_attempted, questions_correct, mastery_level,
+               ROUND(CAST((questions_correct * 100.0 / questions_attempted) AS NUMERIC), 1) as accuracy
+        FROM topic_performance
+        WHERE user_id = $1 AND certification = $2 AND questions_attempted >= 3
+        ORDER BY mastery_level DESC, accuracy DESC
+        LIMIT $3;
+    PREPARE adaptive_topic_extremes (bigint, varchar, int, int) AS
+        WITH scored AS (
+            SELECT topic, questions_attempted, questions_correct, mastery_level,
+                   ROUND(CAST((questions_correct * 100.0 / questions_attempted) AS NUMERIC), 1) as accuracy
+            FROM topic_performance
+            WHERE user_id = $1 AND certification = $2 AND questions_attempted >= 3
+        ), ranked AS (
+            SELECT scored.*,
+                   ROW_NUMBER() OVER (ORDER BY mastery_level ASC, accuracy ASC) AS r_weak,
+                   ROW_NUMBER() OVER (ORDER BY mastery_level DESC, accuracy DESC) AS r_strong
+            FROM scored
+        )
+        SELECT topic, questions_attempted, questions_correct, mastery_level,
+               accuracy, r_weak, r_strong
+        FROM ranked
+        WHERE r_weak <= $3 OR r_strong <= $4;
+"""
+
+def _ensure_prepared(conn):
+    """PREPARE the adaptive statements once per pooled connection"""
+    if getattr(conn, "_adaptive_prepared", False):
+        return
+    cursor = conn.cursor()
+    cursor.execute(_PREPARE_STATEMENTS)
+    conn.commit()
+    cursor.close()
+    conn._adaptive_prepared = True
+
 async def update_topic_performance(user_id, certification, topic, is_correct, response_time=30):
-    """Update user's performance data for adaptive difficulty"""
+    """Queue a performance update; a background task batches the writes"""
+    _ensure_flusher()
+    await _QUEUE.put((user_id, certification, topic, is_correct, response_time))
+
+def _ensure_flusher():
+    """Start the write-behind flush task if it isn't already running"""
+    global _flush_task
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.create_task(_flush_loop())
+
+async def _flush_loop():
+    """Collect queued updates and flush them in batched upserts"""
+    while True:
+        rows = [await _QUEUE.get()]
+        deadline = asyncio.get_running_loop().time() + _FLUSH_INTERVAL
+        while len(rows) < _FLUSH_MAX_ROWS:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                rows.append(await asyncio.wait_for(_QUEUE.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        # Run the blocking psycopg2 work off the event loop so concurrent
+        # users don't serialize behind each other's DB round-trips
+        await asyncio.to_thread(_flush_rows, rows)
+
+def _flush_rows(rows):
+    """Aggregate queued updates per topic and upsert them in one statement"""
+    # ON CONFLICT can't touch the same row twice in one INSERT, so
+    # combine updates for the same (user, certification, topic) first
+    combined = {}
+    for user_id, certification, topic, is_correct, response_time in rows:
+        key = (user_id, certification, topic)
+        attempted, correct, rt_total = combined.get(key, (0, 0, 0))
+        combined[key] = (attempted + 1, correct + int(is_correct),
+                         rt_total + response_time)
+
+    values = [(user_id, certification, topic, attempted, correct,
+               rt_total / attempted)
+              for (user_id, certification, topic),
+                  (attempted, correct, rt_total) in combined.items()]
+
     conn = get_database_connection()
     if not conn:
         return
-    
+
     try:
         cursor = conn.cursor()
-        
-        # Get or create topic performance record
-        cursor.execute("""
-            INSERT INTO topic_performance (user_id, certification, topic, questions_attempted, questions_correct, avg_response_time)
-            VALUES (%s, %s, %s, 1, %s, %s)
-            ON CONFLICT (user_id, certification, topic)
-            DO UPDATE SET
-                questions_attempted = topic_performance.questions_attempted + 1,
-                questions_correct = topic_performance.questions_correct + %s,
-                avg_response_time = (topic_performance.avg_response_time + %s) / 2,
-                last_practiced = CURRENT_TIMESTAMP,
-                mastery_level = CASE 
-                    WHEN topic_performance.questions_attempted + 1 >= 5 THEN
-                        (topic_performance.questions_correct + %s) / CAST(topic_performance.questions_attempted + 1 AS DECIMAL)
-                    ELSE topic_performance.mastery_level
-                END,
-                updated_at = CURRENT_TIMESTAMP
-        """, (user_id, certification, topic, 1 if is_correct else 0, response_time, 
-              1 if is_correct else 0, response_time, 1 if is_correct else 0))
-        
+        execute_values(cursor, _UPSERT_BATCH_SQL, values)
         conn.commit()
         cursor.close()
-        conn.close()
-        
+        release_database_connection(conn)
+
     except Exception as e:
-        print(f"❌ Error updating topic performance: {e}")
-        if conn:
-            conn.close()
+        log.error("❌ Error updating topic performance: %s", e)
+        release_database_connection(conn)
 
 async def get_adaptive_difficulty(user_id, certification, topic):
     """Calculate optimal difficulty for user based on performance"""
-    conn = get_database_connection()
-    if not conn:
-        return "intermediate"
-    
-    try:
-        cursor = conn.cursor()
-        
-        # Get topic performance
-        cursor.execute("""
-            SELECT questions_attempted, questions_correct, mastery_level, current_difficulty
-            FROM topic_performance
-            WHERE user_id = %s AND certification = %s AND topic = %s
-        """, (user_id, certification, topic))
-        
-        result = cursor.fetchone()
-        cursor.close()
-        conn.close()
-        
-        if not result or result['questions_attempted'] < 3:
-            return "intermediate"  # Default for new users
-        
-        mastery = result['mastery_level']
-        
-        # Adaptive difficulty logic
-        if mastery >= 0.85:  # 85%+ accuracy
-            return "advanced"
-        elif mastery >= 0.65:  # 65%+ accuracy 
-            return "intermediate"
-        else:  # Below 65% accuracy
-            return "beginner"
-            
-    except Exception as e:
-        print(f"❌ Error getting adaptive difficulty: {e}")
+    def _fetch():
+        conn = get_database_connection()
+        if not conn:
+            return None
+
+        try:
+            _ensure_prepared(conn)
+            cursor = conn.cursor()
+
+            # Get topic performance
+            cursor.execute("EXECUTE adaptive_get_difficulty (%s, %s, %s)",
+                           (user_id, certification, topic))
+
+            result = cursor.fetchone()
+            cursor.close()
+            release_database_connection(conn)
+            return result
+
+        except Exception as e:
+            log.error("❌ Error getting adaptive difficulty: %s", e)
+            release_database_connection(conn)
+            return None
+
+    result = await asyncio.to_thread(_fetch)
+
+    if not result or result['questions_attempted'] < 3:
+        return "intermediate"  # Default for new users
+
+    mastery = result['mastery_level']
+
+    # Adaptive difficulty logic
+    if mastery >= 0.85:  # 85%+ accuracy
+        return "advanced"
+    elif mastery >= 0.65:  # 65%+ accuracy
         return "intermediate"
+    else:  # Below 65% accuracy
+        return "beginner"
 
 async def get_weak_spots(user_id, certification, limit=5):
     """Identify user's weakest topics for targeted practice"""
-    conn = get_database_connection()
-    if not conn:
-        return []
-    
-    try:
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT topic, questions_attempted, questions_correct, mastery_level,
-                   ROUND(CAST((questions_correct * 100.0 / questions_attempted) AS NUMERIC), 1) as accuracy
-            FROM topic_performance
-            WHERE user_id = %s AND certification = %s AND questions_attempted >= 3
-            ORDER BY mastery_level ASC, accuracy ASC
-            LIMIT %s
-        """, (user_id, certification, limit))
-        
-        result = cursor.fetchall()
-        cursor.close()
-        conn.close()
-        return result
-        
-    except Exception as e:
-        print(f"❌ Error getting weak spots: {e}")
-        if conn:
-            conn.close()
-        return []
+    def _fetch():
+        conn = get_database_connection()
+        if not conn:
+            return []
+
+        try:
+            _ensure_prepared(conn)
+            cursor = conn.cursor()
+
+            cursor.execute("EXECUTE adaptive_weak_spots (%s, %s, %s)",
+                           (user_id, certification, limit))
+
+            result = cursor.fetchall()
+            cursor.close()
+            release_database_connection(conn)
+            return result
+
+        except Exception as e:
+            log.error("❌ Error getting weak spots: %s", e)
+            release_database_connection(conn)
+            return []
+
+    return await asyncio.to_thread(_fetch)
 
 async def get_user_strengths(user_id, certification, limit=5):
     """Get user's strongest topics for confidence building"""
-    conn = get_database_connection()
-    if not conn:
-        return []
-    
-    try:
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT topic, questions_attempted, questions_correct, mastery_level,
-                   ROUND(CAST((questions_correct * 100.0 / questions_attempted) AS NUMERIC), 1) as accuracy
-            FROM topic_performance
-            WHERE user_id = %s AND certification = %s AND questions_attempted >= 3
-            ORDER BY mastery_level DESC, accuracy DESC
-            LIMIT %s
-        """, (user_id, certification, limit))
-        
-        result = cursor.fetchall()
-        cursor.close()
-        conn.close()
-        return result
-        
-    except Exception as e:
-        print(f"❌ Error getting strengths: {e}")
-        if conn:
-            conn.close()
-        return []
\ No newline at end of file
+    def _fetch():
+        conn = get_database_connection()
+        if not conn:
+            return []
+
+        try:
+            _ensure_prepared(conn)
+            cursor = conn.cursor()
+
+            cursor.execute("EXECUTE adaptive_strengths (%s, %s, %s)",
+                           (user_id, certification, limit))
+
+            result = cursor.fetchall()
+            cursor.close()
+            release_database_connection(conn)
+            return result
+
+        except Exception as e:
+            log.error("❌ Error getting strengths: %s", e)
+            release_database_connection(conn)
+            return []
+
+    return await asyncio.to_thread(_fetch)
+
+async def get_topic_extremes(user_id, certification, weak_limit=5, strength_limit=5):
+    """Fetch weakest and strongest topics in a single round-trip.
+
+    Returns (weak_spots, strengths) in the same row format as
+    get_weak_spots/get_user_strengths; callers that need both lists
+    (e.g. /analysis) save one query and one planner invocation.
+    """
+    def _fetch():
+        conn = get_database_connection()
+        if not conn:
+            return []
+
+        try:
+            _ensure_prepared(conn)
+            cursor = conn.cursor()
+
+            cursor.execute("EXECUTE adaptive_topic_extremes (%s, %s, %s, %s)",
+                           (user_id, certification, weak_limit, strength_limit))
+
+            result = cursor.fetchall()
+            cursor.close()
+            release_database_connection(conn)
+            return result
+
+        except Exception as e:
+            log.error("❌ Error getting topic extremes: %s", e)
+            release_database_connection(conn)
+            return []
+
+    rows = await asyncio.to_thread(_fetch)
+
+    weak = sorted((r for r in rows if r['r_weak'] <= weak_limit),
+                  key=lambda r: r['r_weak'])
+    strong = sorted((r for r in rows if r['r_strong'] <= strength_limit),
+                    key=lambda r: r['r_strong'])
+    return weak, strong
@@ -1,54 +1,131 @@
 """OpenAI integration for AI-powered features"""
+import hashlib
+import httpx
+import json
 import openai
-import os
-from config import COMPTIA_CERTS
+import re
+from collections import OrderedDict
+from config import COMPTIA_CERTS, OPENAI_API_KEY
+from ..utils.logger import get_logger
+
+log = get_logger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z0-9+]+")
+
+def _match_topic_locally(question_text, certification):
+    """Pick the domain whose keywords best overlap the question text.
+
+    Domains are short fixed strings, so a token-overlap score resolves
+    most questions locally without an OpenAI round-trip. The per-domain
+    keyword sets are precomputed in config.py. Returns None when no
+    domain keyword appears in the question.
+    """
+    question_tokens = set(_TOKEN_RE.findall(question_text.lower()))
+    best_domain = None
+    best_score = 0
+    for domain, keywords in COMPTIA_CERTS[certification]['domain_keywords']:
+        score = len(keywords & question_tokens)
+        if score > best_score:
+            best_domain = domain
+            best_score = score
+    return best_domain
+
+# LRU cache for topic extraction - the same question text always maps to
+# the same domain, so repeat lookups skip the OpenAI round-trip entirely
+_TOPIC_CACHE: OrderedDict = OrderedDict()
+_TOPIC_CACHE_MAX = 4096
+
+def _topic_cache_key(question_text, certification):
+    digest = hashlib.blake2b(question_text.encode(), digest_size=16).digest()
+    return (certification, digest)
+
+def _remember_topic(key, topic):
+    _TOPIC_CACHE[key] = topic
+    _TOPIC_CACHE.move_to_end(key)
+    if len(_TOPIC_CACHE) > _TOPIC_CACHE_MAX:
+        _TOPIC_CACHE.popitem(last=False)
 
 # Initialize OpenAI client
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 openai_client = None
 
 if OPENAI_API_KEY:
-    openai_client = openai.AsyncOpenAI(api_key=OPENAI_API_KEY)
-    print("🤖 OpenAI Integration: ✅ Enabled")
+    # Explicit deadline and a single retry: a stuck request must not hold
+    # a Discord interaction past its response window, and unbounded SDK
+    # retries double token spend on flaky networks. The shared transport
+    # keeps warm connections to the API so consecutive calls skip the
+    # TCP+TLS handshake. (HTTP/2 would need the optional h2 extra; plain
+    # keep-alive already removes the handshake from the steady state.)
+    openai_client = openai.AsyncOpenAI(
+        api_key=OPENAI_API_KEY,
+        http_client=httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=20,
+                                keepalive_expiry=60)),
+        max_retries=1)
+    log.info("🤖 OpenAI Integration: ✅ Enabled")
 else:
-    print("🤖 OpenAI Integration: ❌ Disabled (No API key)")
+    log.info("🤖 OpenAI Integration: ❌ Disabled (No API key)")
 
 async def extract_topic_from_question(question_text, certification):
     """Use AI to extract the main topic/domain from a question"""
     if not openai_client:
         return "General"
-    
+
+    cache_key = _topic_cache_key(question_text, certification)
+    cached = _TOPIC_CACHE.get(cache_key)
+    if cached is not None:
+        _TOPIC_CACHE.move_to_end(cache_key)
+        return cached
+
+    # Resolve locally when the question text names its domain outright -
+    # no HTTP hop, no token spend
+    local_match = _match_topic_locally(question_text, certification)
+    if local_match is not None:
+        _remember_topic(cache_key, local_match)
+        return local_match
+
     try:
         cert_domains = COMPTIA_CERTS[certification]['domains']
-        domains_list = ", ".join(cert_domains)
-        
+
         prompt = f"""Question: {question_text}
-        
-From this CompTIA {certification} question, identify which domain/topic it belongs to.
-Available domains: {domains_list}
 
-Respond with just the domain name, nothing else."""
-        
+From this CompTIA {certification} question, identify which domain/topic it belongs to."""
+
+        # Constrain the reply to the domain enum via JSON mode so the
+        # model can't return free text needing a fuzzy-match fallback
         response = await openai_client.chat.completions.create(
-            model="gpt-3.5-turbo",
+            model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
-            max_tokens=50,
-            temperature=0.1
+            max_tokens=40,
+            temperature=0.1,
+            timeout=3.5,  # classification is cheap; fail fast to "General"
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "topic",
+                    "strict": True,
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "domain": {"type": "string",
+                                       "enum": list(cert_domains)}
+                        },
+                        "required": ["domain"],
+                        "additionalProperties": False
+                    }
+                }
+            }
         )
-        
-        topic = response.choices[0].message.content.strip()
-        # Validate topic is in our domains list
-        if topic in cert_domains:
-            return topic
-        else:
-            # Find closest match
-            for domain in cert_domains:
-                if any(word.lower() in topic.lower() for word in domain.split()):
-                    return domain
-            return cert_domains[0]  # Default to first domain
-            
+
+        topic = json.loads(response.choices[0].message.content)["domain"]
+        if topic not in COMPTIA_CERTS[certification]['domains_set']:
+            topic = cert_domains[0]  # Safety net; schema should prevent this
+
+        _remember_topic(cache_key, topic)
+        return topic
+
     except Exception as e:
-        print(f"❌ Topic extraction error: {e}")
+        log.error("❌ Topic extraction error: %s", e)
         return "General"
 
 async def generate_study_recommendations(user_id, certification, weak_spots, strengths):
@@ -82,5 +159,5 @@ Format:
         return response.choices[0].message.content.strip()
         
     except Exception as e:
-        print(f"❌ Recommendation error: {e}")
+        log.error("❌ Recommendation error: %s", e)
         return "Focus on your identified weak spots with targeted practice sessions."
\ No newline at end of file
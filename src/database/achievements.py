@@ -1,5 +1,14 @@
 """Achievement system for gamification"""
-from .models import get_database_connection
+import asyncio
+from bisect import bisect_right
+from collections import OrderedDict
+
+from psycopg2.extras import NamedTupleCursor, execute_values
+
+from .models import db_cursor
+from ..utils.logger import get_logger
+
+log = get_logger(__name__)
 
 # Achievement definitions
 ACHIEVEMENTS = {
@@ -40,96 +49,152 @@ ACHIEVEMENTS = {
     }
 }
 
-async def check_achievements(user_id, certification):
+# Volume achievements are pure thresholds on total_questions, so they
+# live in a sorted table and a single bisect yields every rung the user
+# has cleared. Adding a new volume tier is one tuple here, no new code.
+_VOLUME_ACH = sorted([
+    (100, "question_warrior"),
+    (500, "study_legend"),
+])
+_VOLUME_THRESHOLDS = [threshold for threshold, _ in _VOLUME_ACH]
+
+# The remaining achievements need more than one counter; each entry is
+# (id, predicate over the CTE row). Built once at import, not per call.
+_PREDICATE_ACH = [
+    ("accuracy_master",
+     lambda s: s['total_questions'] >= 50 and
+               s['correct_answers'] / s['total_questions'] >= 0.9),
+    ("topic_expert", lambda s: s['mastered'] > 0),
+]
+
+# One round-trip gathers everything the eligibility checks need: the
+# user's counters, the already-earned ids, and the mastered-topic count
+_CHECK_SQL = """
+    WITH u AS (
+        SELECT total_questions, correct_answers
+        FROM users WHERE user_id = %s
+    ), e AS (
+        SELECT array_agg(achievement_id) AS earned
+        FROM user_achievements WHERE user_id = %s
+    ), t AS (
+        SELECT COUNT(*) AS mastered
+        FROM topic_performance
+        WHERE user_id = %s AND certification = %s AND mastery_level >= 0.85
+    )
+    SELECT u.total_questions, u.correct_answers,
+           COALESCE(e.earned, ARRAY[]::varchar[]) AS earned,
+           t.mastered
+    FROM u, e, t
+"""
+
+_INSERT_SQL = """
+    INSERT INTO user_achievements
+        (user_id, achievement_id, achievement_name,
+         achievement_description, category, points)
+    VALUES %s
+    ON CONFLICT (user_id, achievement_id) DO NOTHING
+"""
+
+# Eligibility predicates are monotonic in the user's counters, so a
+# check that found nothing new at a given counter bucket cannot find
+# anything until the counters move to the next bucket. Callers that
+# already hold the stats pass them in; repeat checks inside the same
+# bucket then skip the database entirely. (topic_expert can cross its
+# mastery threshold mid-bucket, delaying that one award by at most a
+# bucket's worth of answers.)
+_CHECK_MEMO: OrderedDict = OrderedDict()
+_CHECK_MEMO_MAX = 4096
+_CHECK_BUCKET = 10
+
+async def check_achievements(user_id, certification, user_stats=None):
     """Check and award new achievements for user"""
-    conn = get_database_connection()
-    if not conn:
-        return []
-    
-    try:
-        cursor = conn.cursor()
-        
-        # Get user stats
-        cursor.execute("SELECT * FROM users WHERE user_id = %s", (user_id,))
-        user_stats = cursor.fetchone()
-        if not user_stats:
+    memo_key = None
+    if user_stats is not None:
+        memo_key = (user_id, certification,
+                    user_stats.get('total_questions', 0) // _CHECK_BUCKET,
+                    user_stats.get('correct_answers', 0) // _CHECK_BUCKET)
+        if memo_key in _CHECK_MEMO:
+            _CHECK_MEMO.move_to_end(memo_key)
             return []
-        
-        # Get existing achievements
-        cursor.execute("SELECT achievement_id FROM user_achievements WHERE user_id = %s", (user_id,))
-        existing = [row['achievement_id'] for row in cursor.fetchall()]
-        
-        new_achievements = []
-        
-        # Check accuracy master
-        if "accuracy_master" not in existing and user_stats['total_questions'] >= 50:
-            accuracy = user_stats['correct_answers'] / user_stats['total_questions']
-            if accuracy >= 0.9:
-                await award_achievement(user_id, "accuracy_master", cursor)
-                new_achievements.append(ACHIEVEMENTS["accuracy_master"])
-        
-        # Check question warrior
-        if "question_warrior" not in existing and user_stats['total_questions'] >= 100:
-            await award_achievement(user_id, "question_warrior", cursor)
-            new_achievements.append(ACHIEVEMENTS["question_warrior"])
-        
-        # Check study legend
-        if "study_legend" not in existing and user_stats['total_questions'] >= 500:
-            await award_achievement(user_id, "study_legend", cursor) 
-            new_achievements.append(ACHIEVEMENTS["study_legend"])
-        
-        # Check topic expert
-        if "topic_expert" not in existing:
-            cursor.execute("""
-                SELECT COUNT(*) as count FROM topic_performance 
-                WHERE user_id = %s AND certification = %s AND mastery_level >= 0.85
-            """, (user_id, certification))
-            if cursor.fetchone()['count'] > 0:
-                await award_achievement(user_id, "topic_expert", cursor)
-                new_achievements.append(ACHIEVEMENTS["topic_expert"])
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
-        return new_achievements
-        
-    except Exception as e:
-        print(f"❌ Error checking achievements: {e}")
-        if conn:
-            conn.close()
-        return []
-
-async def award_achievement(user_id, achievement_id, cursor):
-    """Award an achievement to a user"""
-    achievement = ACHIEVEMENTS[achievement_id]
-    cursor.execute("""
-        INSERT INTO user_achievements (user_id, achievement_id, achievement_name, achievement_description, category, points)
-        VALUES (%s, %s, %s, %s, %s, %s)
-    """, (user_id, achievement_id, achievement['name'], achievement['description'], 
-          achievement['category'], achievement['points']))
+
+    def _check():
+        try:
+            with db_cursor() as cursor:
+                if cursor is None:
+                    return []
+
+                # Single CTE query instead of three serial SELECTs
+                cursor.execute(_CHECK_SQL,
+                               (user_id, user_id, user_id, certification))
+                stats = cursor.fetchone()
+                if not stats:
+                    return []
+
+                total = stats['total_questions']
+                existing = set(stats['earned'])
+
+                # Bisect the sorted threshold table: every rung at or
+                # below the user's question count is eligible
+                cleared = bisect_right(_VOLUME_THRESHOLDS, total)
+                new_ids = [
+                    ach_id for _, ach_id in _VOLUME_ACH[:cleared]
+                    if ach_id not in existing
+                ]
+                new_ids.extend(ach_id for ach_id, eligible in _PREDICATE_ACH
+                               if ach_id not in existing and eligible(stats))
+
+                if new_ids:
+                    # All awards land in one batched INSERT; ON CONFLICT
+                    # keeps a concurrent checker from double-awarding
+                    execute_values(
+                        cursor, _INSERT_SQL,
+                        [(user_id, ach_id, ACHIEVEMENTS[ach_id]['name'],
+                          ACHIEVEMENTS[ach_id]['description'],
+                          ACHIEVEMENTS[ach_id]['category'],
+                          ACHIEVEMENTS[ach_id]['points'])
+                         for ach_id in new_ids])
+
+            return [ACHIEVEMENTS[ach_id] for ach_id in new_ids]
+
+        except Exception as e:
+            log.error("❌ Error checking achievements: %s", e)
+            return []
+
+    # Blocking psycopg2 work runs on a worker thread, keeping the event
+    # loop free while the check round-trips to the database
+    new_achievements = await asyncio.to_thread(_check)
+
+    # Only empty outcomes are memoized: an award changes what the next
+    # check in the same bucket would see
+    if memo_key is not None and not new_achievements:
+        _CHECK_MEMO[memo_key] = True
+        _CHECK_MEMO.move_to_end(memo_key)
+        if len(_CHECK_MEMO) > _CHECK_MEMO_MAX:
+            _CHECK_MEMO.popitem(last=False)
+
+    return new_achievements
 
 async def get_user_achievements(user_id):
     """Get all achievements for a user"""
-    conn = get_database_connection()
-    if not conn:
-        return []
-    
-    try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT achievement_name, achievement_description, category, points, earned_at
-            FROM user_achievements 
-            WHERE user_id = %s
-            ORDER BY earned_at DESC
-        """, (user_id,))
-        
-        result = cursor.fetchall()
-        cursor.close()
-        conn.close()
-        return result
-        
-    except Exception as e:
-        print(f"❌ Error getting achievements: {e}")
-        if conn:
-            conn.close()
-        return []
\ No newline at end of file
+
+    def _fetch():
+        try:
+            # Read-only scan that can grow with the user's history:
+            # namedtuple rows skip the per-row dict allocation that
+            # RealDictCursor (the pool default) pays
+            with db_cursor(cursor_factory=NamedTupleCursor) as cursor:
+                if cursor is None:
+                    return []
+                cursor.execute("""
+                    SELECT achievement_name, achievement_description, category, points, earned_at
+                    FROM user_achievements
+                    WHERE user_id = %s
+                    ORDER BY earned_at DESC
+                """, (user_id,))
+                return cursor.fetchall()
+
+        except Exception as e:
+            log.error("❌ Error getting achievements: %s", e)
+            return []
+
+    return await asyncio.to_thread(_fetch)
\ No newline at end of file
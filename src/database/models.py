@@ -1,155 +1,337 @@
 """Database models and operations"""
-import os
+import asyncio
+import time
+from contextlib import contextmanager
+
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
+from psycopg2.extras import RealDictCursor, execute_values
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 
-# Database configuration
-DATABASE_URL = os.getenv("DATABASE_URL")
+from config import DATABASE_URL
+from ..utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Shared connection pool - avoids a full TCP/TLS/auth round-trip per query
+_POOL = None
+
+class PoolConnection(psycopg2.extensions.connection):
+    """Connection subclass handed out by the pool.
+
+    Being a Python subclass it accepts arbitrary attributes, which lets
+    callers stash per-connection state (e.g. which statements have
+    already been PREPAREd on it).
+    """
+    pass
+
+def _get_pool():
+    """Get or lazily create the shared connection pool"""
+    global _POOL
+    if _POOL is None and DATABASE_URL:
+        try:
+            _POOL = ThreadedConnectionPool(minconn=2, maxconn=25,
+                                           dsn=DATABASE_URL,
+                                           connection_factory=PoolConnection,
+                                           cursor_factory=RealDictCursor)
+        except Exception as e:
+            log.error("❌ Database pool creation failed: %s", e)
+    return _POOL
 
 def get_database_connection():
-    """Get a connection to the PostgreSQL database"""
+    """Get a pooled connection to the PostgreSQL database"""
+    pool = _get_pool()
+    if not pool:
+        return None
     try:
-        return psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
+        return pool.getconn()
     except Exception as e:
-        print(f"❌ Database connection failed: {e}")
+        log.error("❌ Database connection failed: %s", e)
         return None
 
+def release_database_connection(conn):
+    """Return a connection to the pool instead of closing it"""
+    if conn is None:
+        return
+    pool = _get_pool()
+    # Error paths release without committing; roll back so the next
+    # borrower never inherits an aborted transaction. A dead connection
+    # (DB restart, dropped TCP) raises here - that must not stop the
+    # slot from going back to the pool, so the rollback gets its own
+    # guard and marks the connection for disposal
+    broken = False
+    try:
+        if not conn.closed:
+            conn.rollback()
+    except Exception as e:
+        broken = True
+        log.error("❌ Connection rollback on release failed: %s", e)
+    try:
+        if pool:
+            # close= makes the pool discard a dead connection instead of
+            # handing it to the next borrower; the slot frees either way
+            pool.putconn(conn, close=broken or bool(conn.closed))
+        else:
+            conn.close()
+    except Exception as e:
+        log.error("❌ Database connection release failed: %s", e)
+
+@contextmanager
+def db_cursor(cursor_factory=None):
+    """Borrow a pooled connection and yield a cursor on it.
+
+    Commits when the block exits cleanly and always returns the
+    connection to the pool - release rolls back anything uncommitted on
+    error paths, so no caller can leak a connection or an aborted
+    transaction. Yields None when no database is configured so callers
+    can take their in-memory fallbacks.
+    """
+    conn = get_database_connection()
+    if not conn:
+        yield None
+        return
+    try:
+        cursor = (conn.cursor(cursor_factory=cursor_factory)
+                  if cursor_factory else conn.cursor())
+        try:
+            yield cursor
+            conn.commit()
+        finally:
+            cursor.close()
+    finally:
+        release_database_connection(conn)
+
+# Bump this whenever the DDL below changes; a mismatched (or missing)
+# sentinel row makes the next startup re-run the full schema pass
+_SCHEMA_VERSION = "1"
+
+# The whole schema ships as one multi-statement string so a cold start
+# behind a remote Postgres pays one round-trip instead of a dozen;
+# psycopg2 sends it as a single command and commit/rollback covers all
+# of it as one transaction
+_SCHEMA_SQL = """
+    -- Users table for study progress tracking
+    CREATE TABLE IF NOT EXISTS users (
+        user_id BIGINT PRIMARY KEY,
+        username VARCHAR(100),
+        selected_cert VARCHAR(50),
+        study_streak INTEGER DEFAULT 0,
+        total_questions INTEGER DEFAULT 0,
+        correct_answers INTEGER DEFAULT 0,
+        study_score INTEGER DEFAULT 0,
+        study_time_minutes INTEGER DEFAULT 0,
+        last_study_date TIMESTAMP,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Question history for detailed tracking
+    CREATE TABLE IF NOT EXISTS question_history (
+        id SERIAL PRIMARY KEY,
+        user_id BIGINT REFERENCES users(user_id),
+        certification VARCHAR(50),
+        difficulty VARCHAR(20),
+        question_text TEXT,
+        user_answer CHAR(1),
+        correct_answer CHAR(1),
+        is_correct BOOLEAN,
+        response_time_seconds INTEGER,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Study sessions for detailed progress tracking
+    CREATE TABLE IF NOT EXISTS study_sessions (
+        id SERIAL PRIMARY KEY,
+        user_id BIGINT REFERENCES users(user_id),
+        session_type VARCHAR(50),
+        duration_minutes INTEGER,
+        questions_answered INTEGER DEFAULT 0,
+        questions_correct INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Topic performance for adaptive difficulty and weak spot analysis
+    CREATE TABLE IF NOT EXISTS topic_performance (
+        id SERIAL PRIMARY KEY,
+        user_id BIGINT REFERENCES users(user_id),
+        certification VARCHAR(50),
+        topic VARCHAR(100),
+        questions_attempted INTEGER DEFAULT 0,
+        questions_correct INTEGER DEFAULT 0,
+        current_difficulty VARCHAR(20) DEFAULT 'intermediate',
+        avg_response_time DECIMAL DEFAULT 0,
+        last_practiced TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        mastery_level DECIMAL DEFAULT 0.0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(user_id, certification, topic)
+    );
+
+    -- Partial indexes matching the weak-spot/strength queries: both
+    -- filter on questions_attempted >= 3 and sort by mastery_level,
+    -- so these turn a seq scan + sort into an index scan + limit
+    CREATE INDEX IF NOT EXISTS idx_tp_weak
+    ON topic_performance (user_id, certification, mastery_level ASC)
+    WHERE questions_attempted >= 3;
+    CREATE INDEX IF NOT EXISTS idx_tp_strong
+    ON topic_performance (user_id, certification, mastery_level DESC)
+    WHERE questions_attempted >= 3;
+
+    -- User achievements for gamification
+    CREATE TABLE IF NOT EXISTS user_achievements (
+        id SERIAL PRIMARY KEY,
+        user_id BIGINT REFERENCES users(user_id),
+        achievement_id VARCHAR(100),
+        achievement_name VARCHAR(200),
+        achievement_description TEXT,
+        earned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        category VARCHAR(50),
+        points INTEGER DEFAULT 0,
+        UNIQUE(user_id, achievement_id)
+    );
+
+    -- Indexes backing the leaderboard and achievement hot queries:
+    -- daily champions joins question_history per user on a date range,
+    -- topic_expert counts mastered topics, and the achievements panel
+    -- reads one user's rows
+    CREATE INDEX IF NOT EXISTS idx_qh_user_created
+    ON question_history (user_id, created_at);
+    CREATE INDEX IF NOT EXISTS idx_tp_user_cert_mastery
+    ON topic_performance (user_id, certification, mastery_level);
+    CREATE INDEX IF NOT EXISTS idx_ua_user
+    ON user_achievements (user_id);
+
+    -- Adaptive settings for personalized difficulty
+    CREATE TABLE IF NOT EXISTS adaptive_settings (
+        user_id BIGINT PRIMARY KEY REFERENCES users(user_id),
+        base_difficulty VARCHAR(20) DEFAULT 'intermediate',
+        learning_rate DECIMAL DEFAULT 0.1,
+        confidence_threshold DECIMAL DEFAULT 0.75,
+        adaptation_speed VARCHAR(20) DEFAULT 'normal',
+        preferred_question_types TEXT[],
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
 def initialize_database():
     """Create the database schema if it doesn't exist"""
     if not DATABASE_URL:
-        print("⚠️ No database URL configured, skipping database initialization")
+        log.warning("⚠️ No database URL configured, skipping database initialization")
         return False
-        
-    conn = get_database_connection()
-    if not conn:
-        return False
-        
+
     try:
-        cursor = conn.cursor()
-        
-        # Create users table for study progress tracking
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                user_id BIGINT PRIMARY KEY,
-                username VARCHAR(100),
-                selected_cert VARCHAR(50),
-                study_streak INTEGER DEFAULT 0,
-                total_questions INTEGER DEFAULT 0,
-                correct_answers INTEGER DEFAULT 0,
-                study_score INTEGER DEFAULT 0,
-                study_time_minutes INTEGER DEFAULT 0,
-                last_study_date TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Create question_history table for detailed tracking
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS question_history (
-                id SERIAL PRIMARY KEY,
-                user_id BIGINT REFERENCES users(user_id),
-                certification VARCHAR(50),
-                difficulty VARCHAR(20),
-                question_text TEXT,
-                user_answer CHAR(1),
-                correct_answer CHAR(1),
-                is_correct BOOLEAN,
-                response_time_seconds INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Create study_sessions table for detailed progress tracking
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS study_sessions (
-                id SERIAL PRIMARY KEY,
-                user_id BIGINT REFERENCES users(user_id),
-                session_type VARCHAR(50),
-                duration_minutes INTEGER,
-                questions_answered INTEGER DEFAULT 0,
-                questions_correct INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Create topic_performance table for adaptive difficulty and weak spot analysis
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS topic_performance (
-                id SERIAL PRIMARY KEY,
-                user_id BIGINT REFERENCES users(user_id),
-                certification VARCHAR(50),
-                topic VARCHAR(100),
-                questions_attempted INTEGER DEFAULT 0,
-                questions_correct INTEGER DEFAULT 0,
-                current_difficulty VARCHAR(20) DEFAULT 'intermediate',
-                avg_response_time DECIMAL DEFAULT 0,
-                last_practiced TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                mastery_level DECIMAL DEFAULT 0.0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(user_id, certification, topic)
-            )
-        """)
-        
-        # Create user_achievements table for gamification
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_achievements (
-                id SERIAL PRIMARY KEY,
-                user_id BIGINT REFERENCES users(user_id),
-                achievement_id VARCHAR(100),
-                achievement_name VARCHAR(200),
-                achievement_description TEXT,
-                earned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                category VARCHAR(50),
-                points INTEGER DEFAULT 0,
-                UNIQUE(user_id, achievement_id)
-            )
-        """)
-        
-        # Create adaptive_settings table for personalized difficulty
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS adaptive_settings (
-                user_id BIGINT PRIMARY KEY REFERENCES users(user_id),
-                base_difficulty VARCHAR(20) DEFAULT 'intermediate',
-                learning_rate DECIMAL DEFAULT 0.1,
-                confidence_threshold DECIMAL DEFAULT 0.75,
-                adaptation_speed VARCHAR(20) DEFAULT 'normal',
-                preferred_question_types TEXT[],
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        conn.commit()
-        cursor.close()
-        conn.close()
-        
-        print("✅ Database schema initialized successfully")
+        with db_cursor() as cursor:
+            if cursor is None:
+                return False
+
+            # Sentinel check: if a previous boot already created this
+            # schema version, skip the CREATE TABLE/INDEX catalog work
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS schema_meta (
+                    key VARCHAR(50) PRIMARY KEY,
+                    value VARCHAR(50)
+                )
+            """)
+            cursor.execute(
+                "SELECT value FROM schema_meta WHERE key = 'version'")
+            row = cursor.fetchone()
+            if row and row['value'] == _SCHEMA_VERSION:
+                return True
+
+            # One execute ships the whole schema - tables and indexes -
+            # in a single round-trip
+            cursor.execute(_SCHEMA_SQL)
+
+            # Record the version so the next boot short-circuits above
+            cursor.execute("""
+                INSERT INTO schema_meta (key, value) VALUES ('version', %s)
+                ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value
+            """, (_SCHEMA_VERSION,))
+
+        log.info("✅ Database schema initialized successfully")
         return True
-        
+
     except Exception as e:
-        print(f"❌ Database schema creation failed: {e}")
-        if conn:
-            conn.close()
+        log.error("❌ Database schema creation failed: %s", e)
         return False
 
+# Short-TTL cache for user rows: command bursts (practice -> stats ->
+# analysis within seconds) re-read the same row; writes invalidate below
+_USER_CACHE: Dict[int, tuple] = {}
+_USER_CACHE_TTL = 5.0
+
+# The hottest statements are PREPAREd once per pooled connection
+# (mirroring ai/adaptive.py), so Postgres skips the parse/plan step on
+# every later call from that connection.
+#
+# models_get_user serves both the hot and cold path: existing rows come
+# back via RETURNING (only the seven columns callers read - no SELECT *
+# shipping username/created_at/updated_at), and a first-time user is
+# created without a separate INSERT round-trip.
+#
+# models_increment_stats upserts for the same reason: a user whose first
+# interaction is /pomodoro has no row yet, and a bare UPDATE would match
+# nothing and silently drop the minutes.
+_PREPARE_STATEMENTS = """
+    PREPARE models_get_user (bigint, varchar) AS
+        INSERT INTO users (user_id, username, selected_cert, study_streak,
+                           total_questions, correct_answers, study_score,
+                           study_time_minutes, last_study_date)
+        VALUES ($1, $2, 'A+', 0, 0, 0, 0, 0, CURRENT_TIMESTAMP)
+        ON CONFLICT (user_id) DO UPDATE
+            SET username = COALESCE(EXCLUDED.username, users.username)
+        RETURNING selected_cert, study_streak, total_questions,
+                  correct_answers, study_score, study_time_minutes,
+                  last_study_date;
+    PREPARE models_increment_stats (int, int, int, int, bigint) AS
+        INSERT INTO users (user_id, selected_cert, study_streak,
+                           total_questions, correct_answers, study_score,
+                           study_time_minutes, last_study_date)
+        VALUES ($5, 'A+', 0, $1, $2, $3, $4, CURRENT_TIMESTAMP)
+        ON CONFLICT (user_id) DO UPDATE SET
+            total_questions = users.total_questions + $1,
+            correct_answers = users.correct_answers + $2,
+            study_score = users.study_score + $3,
+            study_time_minutes = users.study_time_minutes + $4,
+            last_study_date = CURRENT_TIMESTAMP,
+            updated_at = CURRENT_TIMESTAMP
+        RETURNING total_questions, correct_answers, study_score,
+                  study_time_minutes;
+"""
+
+def _ensure_prepared(conn):
+    """PREPARE the hot user statements once per pooled connection"""
+    if getattr(conn, "_models_prepared", False):
+        return
+    cursor = conn.cursor()
+    cursor.execute(_PREPARE_STATEMENTS)
+    conn.commit()
+    cursor.close()
+    conn._models_prepared = True
+
 async def get_user_data(user_id: int, username: Optional[str] = None):
     """Get or create user data from database"""
-    conn = get_database_connection()
-    if not conn:
-        # Fallback to in-memory for backward compatibility
-        return initialize_user_data_memory(user_id)
-        
-    try:
-        cursor = conn.cursor()
-        
-        # Try to get existing user
-        cursor.execute("SELECT * FROM users WHERE user_id = %s", (user_id,))
-        user = cursor.fetchone()
-        
-        if user:
+    cached = _USER_CACHE.get(user_id)
+    if cached and time.monotonic() - cached[0] < _USER_CACHE_TTL:
+        # Hand out a copy so concurrent commands don't mutate shared state
+        return dict(cached[1])
+
+    def _fetch():
+        try:
+            with db_cursor() as cursor:
+                if cursor is None:
+                    # Fallback to in-memory for backward compatibility
+                    return initialize_user_data_memory(user_id)
+
+                _ensure_prepared(cursor.connection)
+
+                # Upsert-and-return: one round-trip whether or not the
+                # user already exists
+                cursor.execute("EXECUTE models_get_user (%s, %s)",
+                               (user_id, username))
+                user = cursor.fetchone()
+
             # Convert database row to dictionary format matching current system
             user_data = {
                 "selected_cert": user['selected_cert'] or "A+",
@@ -160,36 +342,18 @@ async def get_user_data(user_id: int, username: Optional[str] = None):
                 "study_time_minutes": user['study_time_minutes'],
                 "last_study_date": user['last_study_date']
             }
-        else:
-            # Create new user
-            cursor.execute("""
-                INSERT INTO users (user_id, username, selected_cert, study_streak, 
-                                 total_questions, correct_answers, study_score, 
-                                 study_time_minutes, last_study_date)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (user_id, username, "A+", 0, 0, 0, 0, 0, datetime.utcnow()))
-            conn.commit()
-            
-            user_data = {
-                "selected_cert": "A+",
-                "study_streak": 0,
-                "total_questions": 0,
-                "correct_answers": 0,
-                "study_score": 0,
-                "study_time_minutes": 0,
-                "last_study_date": datetime.utcnow()
-            }
-        
-        cursor.close()
-        conn.close()
-        return user_data
-        
-    except Exception as e:
-        print(f"❌ Error getting user data: {e}")
-        if conn:
-            conn.close()
-        # Fallback to in-memory system
-        return initialize_user_data_memory(user_id)
+
+            _USER_CACHE[user_id] = (time.monotonic(), dict(user_data))
+            return user_data
+
+        except Exception as e:
+            log.error("❌ Error getting user data: %s", e)
+            # Fallback to in-memory system
+            return initialize_user_data_memory(user_id)
+
+    # psycopg2 I/O is synchronous; run it on a worker thread so the
+    # Discord event loop keeps servicing other interactions meanwhile
+    return await asyncio.to_thread(_fetch)
 
 def initialize_user_data_memory(user_id: int) -> Dict[str, Any]:
     """Fallback in-memory user data initialization"""
@@ -205,86 +369,178 @@ def initialize_user_data_memory(user_id: int) -> Dict[str, Any]:
 
 async def update_user_data(user_id: int, data: dict):
     """Update user data in database"""
-    conn = get_database_connection()
-    if not conn:
-        return False
-        
+    # Writes invalidate the read caches so the next fetch sees fresh data
+    _USER_CACHE.pop(user_id, None)
+    _LB_CACHE.clear()
+
+    def _write():
+        try:
+            with db_cursor() as cursor:
+                if cursor is None:
+                    return False
+
+                # Update user record
+                cursor.execute("""
+                    UPDATE users SET
+                        selected_cert = %s,
+                        study_streak = %s,
+                        total_questions = %s,
+                        correct_answers = %s,
+                        study_score = %s,
+                        study_time_minutes = %s,
+                        last_study_date = %s,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE user_id = %s
+                """, (
+                    data.get('selected_cert'),
+                    data.get('study_streak'),
+                    data.get('total_questions'),
+                    data.get('correct_answers'),
+                    data.get('study_score'),
+                    data.get('study_time_minutes'),
+                    data.get('last_study_date'),
+                    user_id
+                ))
+            return True
+
+        except Exception as e:
+            log.error("❌ Error updating user data: %s", e)
+            return False
+
+    return await asyncio.to_thread(_write)
+
+async def increment_user_stats(user_id: int, questions: int = 0,
+                               correct: int = 0, score: int = 0,
+                               minutes: int = 0):
+    """Apply counter deltas atomically and return the fresh counters.
+
+    A single delta UPDATE replaces the fetch/mutate/overwrite cycle, so
+    two answers landing at once both count instead of the last writer
+    erasing the first. Returns the updated row, or None on failure.
+    """
+    _USER_CACHE.pop(user_id, None)
+    _LB_CACHE.clear()
+
+    def _write():
+        try:
+            with db_cursor() as cursor:
+                if cursor is None:
+                    return None
+                _ensure_prepared(cursor.connection)
+                cursor.execute(
+                    "EXECUTE models_increment_stats (%s, %s, %s, %s, %s)",
+                    (questions, correct, score, minutes, user_id))
+                return cursor.fetchone()
+
+        except Exception as e:
+            log.error("❌ Error incrementing user stats: %s", e)
+            return None
+
+    return await asyncio.to_thread(_write)
+
+# Write-behind buffer for question history, mirroring the batching in
+# ai/adaptive.py: each answer enqueues a row and a background task
+# flushes bursts in one execute_values INSERT instead of a round-trip
+# per answered question
+_QH_FLUSH_INTERVAL = 2.0  # seconds to wait for more rows before flushing
+_QH_FLUSH_MAX_ROWS = 50
+
+_QH_QUEUE: "asyncio.Queue" = asyncio.Queue()
+_qh_flush_task = None
+
+_QH_INSERT_SQL = """
+    INSERT INTO question_history
+        (user_id, certification, difficulty, question_text, user_answer,
+         correct_answer, is_correct, response_time_seconds)
+    VALUES %s
+"""
+
+async def record_answer(user_id, certification, question_text, user_answer,
+                        correct_answer, is_correct, difficulty=None,
+                        response_time_seconds=30):
+    """Queue one answered question; a background task batches the inserts"""
+    _ensure_qh_flusher()
+    await _QH_QUEUE.put((user_id, certification, difficulty, question_text,
+                         user_answer, correct_answer, is_correct,
+                         response_time_seconds))
+
+def _ensure_qh_flusher():
+    """Start the history flush task if it isn't already running"""
+    global _qh_flush_task
+    if _qh_flush_task is None or _qh_flush_task.done():
+        _qh_flush_task = asyncio.create_task(_qh_flush_loop())
+
+async def _qh_flush_loop():
+    """Collect queued history rows and flush them in batched inserts"""
+    while True:
+        rows = [await _QH_QUEUE.get()]
+        deadline = asyncio.get_running_loop().time() + _QH_FLUSH_INTERVAL
+        while len(rows) < _QH_FLUSH_MAX_ROWS:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                rows.append(await asyncio.wait_for(_QH_QUEUE.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        await asyncio.to_thread(_qh_flush_rows, rows)
+
+def _qh_flush_rows(rows):
+    """Insert a batch of history rows in one statement"""
     try:
-        cursor = conn.cursor()
-        
-        # Update user record
-        cursor.execute("""
-            UPDATE users SET
-                selected_cert = %s,
-                study_streak = %s,
-                total_questions = %s,
-                correct_answers = %s,
-                study_score = %s,
-                study_time_minutes = %s,
-                last_study_date = %s,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE user_id = %s
-        """, (
-            data.get('selected_cert'),
-            data.get('study_streak'),
-            data.get('total_questions'),
-            data.get('correct_answers'),
-            data.get('study_score'),
-            data.get('study_time_minutes'),
-            data.get('last_study_date'),
-            user_id
-        ))
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
-        return True
-        
+        with db_cursor() as cursor:
+            if cursor is None:
+                return
+            execute_values(cursor, _QH_INSERT_SQL, rows)
     except Exception as e:
-        print(f"❌ Error updating user data: {e}")
-        if conn:
-            conn.close()
-        return False
+        log.error("❌ Error recording question history: %s", e)
 
 # Leaderboard functions
+
+# The leaderboards are aggregate scans over users/question_history but
+# only change when someone records progress, so repeated renders within
+# the TTL reuse the last result; writes clear the cache below
+_LB_CACHE: Dict[str, tuple] = {}
+_LB_CACHE_TTL = 60.0
+
+async def _cached_leaderboard(key, query, label):
+    cached = _LB_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < _LB_CACHE_TTL:
+        return cached[1]
+    result = await asyncio.to_thread(_fetch_leaderboard, query, label)
+    _LB_CACHE[key] = (time.monotonic(), result)
+    return result
+
+def _fetch_leaderboard(query, label):
+    """Run one leaderboard query on a pooled connection (sync)"""
+    try:
+        with db_cursor() as cursor:
+            if cursor is None:
+                return []
+            cursor.execute(query)
+            return cursor.fetchall()
+    except Exception as e:
+        log.error("❌ Error getting %s: %s", label, e)
+        return []
+
 async def get_daily_champions():
     """Get top 5 users by questions answered today"""
-    conn = get_database_connection()
-    if not conn:
-        return []
-    
-    try:
-        cursor = conn.cursor()
-        cursor.execute("""
+    return await _cached_leaderboard("daily", """
             SELECT u.username, u.user_id, COUNT(qh.id) as questions_today
             FROM users u
-            LEFT JOIN question_history qh ON u.user_id = qh.user_id 
-                AND DATE(qh.created_at) = CURRENT_DATE
+            LEFT JOIN question_history qh ON u.user_id = qh.user_id
+                AND qh.created_at >= CURRENT_DATE
+                AND qh.created_at < CURRENT_DATE + 1
             GROUP BY u.user_id, u.username
             HAVING COUNT(qh.id) > 0
             ORDER BY questions_today DESC
             LIMIT 5
-        """)
-        result = cursor.fetchall()
-        cursor.close()
-        conn.close()
-        return result
-    except Exception as e:
-        print(f"❌ Error getting daily champions: {e}")
-        if conn:
-            conn.close()
-        return []
+        """, "daily champions")
 
 async def get_accuracy_masters():
     """Get top 5 users by accuracy rate (minimum 10 questions)"""
-    conn = get_database_connection()
-    if not conn:
-        return []
-    
-    try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT u.username, u.user_id, 
+    return await _cached_leaderboard("accuracy", """
+            SELECT u.username, u.user_id,
                    u.total_questions,
                    u.correct_answers,
                    ROUND(CAST((u.correct_answers * 100.0 / u.total_questions) AS NUMERIC), 1) as accuracy
@@ -292,38 +548,81 @@ async def get_accuracy_masters():
             WHERE u.total_questions >= 10
             ORDER BY accuracy DESC
             LIMIT 5
-        """)
-        result = cursor.fetchall()
-        cursor.close()
-        conn.close()
-        return result
-    except Exception as e:
-        print(f"❌ Error getting accuracy masters: {e}")
-        if conn:
-            conn.close()
-        return []
+        """, "accuracy masters")
 
 async def get_study_legends():
     """Get top 5 users by overall study score"""
-    conn = get_database_connection()
-    if not conn:
-        return []
-    
-    try:
-        cursor = conn.cursor()
-        cursor.execute("""
+    return await _cached_leaderboard("legends", """
             SELECT u.username, u.user_id, u.study_score, u.total_questions
             FROM users u
             WHERE u.total_questions > 0
             ORDER BY u.study_score DESC
             LIMIT 5
-        """)
-        result = cursor.fetchall()
-        cursor.close()
-        conn.close()
-        return result
-    except Exception as e:
-        print(f"❌ Error getting study legends: {e}")
-        if conn:
-            conn.close()
-        return []
\ No newline at end of file
+        """, "study legends")
+
+# The /leaderboard panel renders all three boards at once; bundling the
+# three queries into one statement pays a single round-trip instead of
+# three, with each board coming back as a json_agg array
+_ALL_LB_SQL = """
+    WITH dc AS (
+        SELECT u.username, u.user_id, COUNT(qh.id) as questions_today
+        FROM users u
+        LEFT JOIN question_history qh ON u.user_id = qh.user_id
+            AND qh.created_at >= CURRENT_DATE
+            AND qh.created_at < CURRENT_DATE + 1
+        GROUP BY u.user_id, u.username
+        HAVING COUNT(qh.id) > 0
+        ORDER BY questions_today DESC
+        LIMIT 5
+    ), am AS (
+        SELECT u.username, u.user_id,
+               u.total_questions,
+               u.correct_answers,
+               ROUND(CAST((u.correct_answers * 100.0 / u.total_questions) AS NUMERIC), 1) as accuracy
+        FROM users u
+        WHERE u.total_questions >= 10
+        ORDER BY accuracy DESC
+        LIMIT 5
+    ), sl AS (
+        SELECT u.username, u.user_id, u.study_score, u.total_questions
+        FROM users u
+        WHERE u.total_questions > 0
+        ORDER BY u.study_score DESC
+        LIMIT 5
+    )
+    SELECT (SELECT json_agg(dc) FROM dc) AS daily,
+           (SELECT json_agg(am) FROM am) AS accuracy,
+           (SELECT json_agg(sl) FROM sl) AS legends
+"""
+
+async def get_all_leaderboards():
+    """Fetch all three leaderboards in a single round-trip.
+
+    Returns a dict with 'daily', 'accuracy', and 'legends' lists shaped
+    like the individual helpers' rows. Shares the leaderboard cache, so
+    repeated panel renders within the TTL hit neither path.
+    """
+    cached = _LB_CACHE.get("all")
+    if cached and time.monotonic() - cached[0] < _LB_CACHE_TTL:
+        return cached[1]
+
+    def _fetch():
+        try:
+            with db_cursor() as cursor:
+                if cursor is None:
+                    return {"daily": [], "accuracy": [], "legends": []}
+                cursor.execute(_ALL_LB_SQL)
+                row = cursor.fetchone()
+            # json_agg returns NULL (None) for an empty board
+            return {
+                "daily": row['daily'] or [],
+                "accuracy": row['accuracy'] or [],
+                "legends": row['legends'] or [],
+            }
+        except Exception as e:
+            log.error("❌ Error getting leaderboards: %s", e)
+            return {"daily": [], "accuracy": [], "legends": []}
+
+    result = await asyncio.to_thread(_fetch)
+    _LB_CACHE["all"] = (time.monotonic(), result)
+    return result
\ No newline at end of file
@@ -1,74 +1,205 @@
 """Discord UI components and interactive elements"""
 import discord
 import asyncio
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-from src.database.models import get_user_data, update_user_data  
-from src.ai.openai_client import extract_topic_from_question
-from src.ai.adaptive import update_topic_performance
+import contextlib
+import copy
+import functools
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from ..database.models import get_user_data, increment_user_stats, record_answer
+from ..ai.openai_client import extract_topic_from_question
+from ..ai.adaptive import update_topic_performance
+from ..utils.logger import get_logger
+
+log = get_logger(__name__)
+
+@dataclass(slots=True)
+class QuestionEntry:
+    """One practice question, preprocessed at session start.
+
+    The options block is rendered once here so question transitions
+    never rebuild it, and the whole pool lives in an immutable tuple
+    that views advance through by index - no O(n) list.pop(0) and no
+    per-question dict re-iteration.
+    """
+    question: str
+    answer: str
+    explanation: str
+    options_text: str
+    # Domain the generator tagged the question with; when present, the
+    # adaptive-learning update skips its topic-extraction AI call
+    topic: str = None
+
+def build_question_entries(parsed_questions):
+    """Preprocess parsed question dicts into an immutable entry tuple"""
+    entries = []
+    for question_data in parsed_questions:
+        options = question_data.get('options')
+        if options:
+            options_text = "```\n" + "".join(
+                f"{letter.upper()})  {option}\n"
+                for letter, option in options.items()) + "```"
+        else:
+            options_text = ""
+        entries.append(QuestionEntry(question_data['question'],
+                                     question_data['answer'],
+                                     question_data['explanation'],
+                                     options_text,
+                                     question_data.get('topic')))
+    return tuple(entries)
+
+class _ChannelLimiter:
+    """Cooperative token bucket matching Discord's 5-per-5s channel bucket.
+
+    Concurrent practice sessions in one channel can burst edits and
+    sends past the REST limit and trigger 429 backoffs that stall every
+    session in the channel. Pacing locally keeps the bot just under the
+    bucket so discord.py never has to park requests behind a retry.
+    """
+    __slots__ = ('capacity', 'period', '_stamps', '_lock')
+
+    def __init__(self, capacity=5, period=5.0):
+        self.capacity = capacity
+        self.period = period
+        self._stamps = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            while self._stamps and now - self._stamps[0] >= self.period:
+                self._stamps.popleft()
+            if len(self._stamps) >= self.capacity:
+                await asyncio.sleep(self.period - (now - self._stamps[0]))
+                now = loop.time()
+                while self._stamps and now - self._stamps[0] >= self.period:
+                    self._stamps.popleft()
+            self._stamps.append(now)
+
+_CHANNEL_LIMITERS: dict = {}
+
+async def _throttle(channel_id):
+    """Wait for a slot in the channel's token bucket"""
+    limiter = _CHANNEL_LIMITERS.get(channel_id)
+    if limiter is None:
+        limiter = _CHANNEL_LIMITERS[channel_id] = _ChannelLimiter()
+    await limiter.acquire()
 
 class PracticeQuestionView(discord.ui.View):
     """
     Interactive Discord view with buttons for answering practice questions.
-    
+
     This creates A, B, C, D buttons that users can click to submit their answers.
     Tracks scoring and provides immediate feedback, then shows next question if available.
     """
-    
-    def __init__(self, correct_answer: str, explanation: str, user_id: int, 
-                 question_number: int, total_questions: int, remaining_questions: list, 
-                 interaction_context, question_text: str = None, certification: str = None):
+
+    # Theme constants shared by every embed this view produces - one
+    # place to retheme instead of magic numbers at each call site
+    COLOR_THEME = 0x2B2D31  # Professional dark theme
+    COLOR_GREEN = 0x00ff00  # Correct answer / session complete
+    COLOR_RED = 0xff4444    # Wrong answer / time pressure
+    EMOJI_CORRECT = "✅"
+    EMOJI_WRONG = "❌"
+
+    # Label and emoji for the four answer buttons, built manually in
+    # __init__ with one shared callback instead of four decorated
+    # methods - no per-instance decorator descriptor walk
+    _BUTTON_SPECS = (('A', '🅰️'), ('B', '🅱️'), ('C', '🔴'), ('D', '🔵'))
+
+    def __init__(self, correct_answer: str, explanation: str, user_id: int,
+                 question_number: int, total_questions: int, questions: tuple,
+                 interaction_context, question_text: str = None, certification: str = None,
+                 user_data: dict = None, question_topic: str = None):
         super().__init__(timeout=60)
+        for label, emoji in self._BUTTON_SPECS:
+            button = discord.ui.Button(label=label,
+                                       style=discord.ButtonStyle.primary,
+                                       emoji=emoji)
+            button.callback = functools.partial(self._on_answer_button,
+                                                label=label)
+            self.add_item(button)
         self.correct_answer = correct_answer.upper()
         self.explanation = explanation
         self.user_id = user_id
         self.question_number = question_number
         self.total_questions = total_questions
-        self.remaining_questions = remaining_questions
+        # Full session pool; question_number doubles as the cursor,
+        # so the next entry is questions[question_number]
+        self.questions = questions
         self.interaction_context = interaction_context
         self.answered = False
         self.original_message = None
-        self.countdown_task = None
+        self._alert_handle = None
+        self._alert_task = None
         self.question_text = question_text
+        self.question_topic = question_topic
         self.certification = certification
+        # The user's row travels with the session: each answer updates
+        # it locally, so question transitions never re-read the
+        # database just for display data
+        self.user_data = user_data
+        # Answer deltas accumulate here and flush to the database every
+        # few answers and at session end/timeout - a 20-question session
+        # costs a handful of writes instead of twenty
+        self._pending_correct = 0
+        self._pending_score = 0
+        self._unflushed_answers = 0
         
     async def start_countdown(self, message):
-        """Start the countdown timer for this question"""
+        """Arm the red-alert timer for this question.
+
+        A call_later handle is one entry in the event loop's shared
+        timer heap; a dedicated task per question would instead hold a
+        coroutine frame sleeping for 50 seconds, and those add up under
+        many concurrent sessions. The coroutine only exists for the
+        moment the alert actually fires.
+        """
         self.original_message = message
-        self.countdown_task = asyncio.create_task(self._countdown_loop())
-        
-    async def _countdown_loop(self):
-        """Handle the countdown timer with color changes"""
+        self._alert_handle = asyncio.get_running_loop().call_later(
+            50, self._fire_alert)
+
+    def _fire_alert(self):
+        """Timer callback: run the red-alert edit as a task"""
+        self._alert_task = asyncio.create_task(self._red_alert())
+
+    async def _red_alert(self):
+        """Flash the question red when 10 seconds remain.
+
+        The <t:..:R> deadline in the embed counts down on every client
+        with zero REST traffic, so the only server-side work left is a
+        single color-change edit for the final-stretch visual. The
+        view's timeout=60 handles expiry on its own.
+        """
         try:
+            if self.answered:
+                return
+
             embed = self.original_message.embeds[0] if self.original_message.embeds else None
             if not embed:
                 return
-                
-            countdown_times = [60, 55, 50, 45, 40, 35, 30, 25, 20, 15, 10, 5]
-            
-            for remaining in countdown_times:
-                if self.answered:
-                    return
-                    
-                # Change color based on time remaining
-                if remaining > 30:
-                    embed.color = 0x7289da  # Blue - plenty of time
-                elif remaining > 10: 
-                    embed.color = 0xffa500  # Orange - getting urgent
-                else:
-                    embed.color = 0xff4444  # Red - almost out of time
-                    
-                embed.set_footer(text=f"⏰ Time remaining: {remaining} seconds - Click a button to answer!")
-                
-                try:
-                    await self.original_message.edit(embed=embed, view=self)
-                    await asyncio.sleep(5)  # Update every 5 seconds
-                except discord.NotFound:
-                    return
-                except discord.HTTPException:
-                    pass
-                    
+
+            # Content-diff guard: if something already turned the embed
+            # red, an identical edit would spend a rate-limit slot for
+            # a no-op payload
+            if embed.colour is not None and embed.colour.value == self.COLOR_RED:
+                return
+
+            embed.color = self.COLOR_RED  # Almost out of time
+
+            try:
+                # Buttons haven't changed, so omit view= and keep the
+                # components payload out of the edit - Discord leaves
+                # the existing view attached
+                await _throttle(self.original_message.channel.id)
+                await self.original_message.edit(embed=embed)
+            except discord.NotFound:
+                return
+            except discord.HTTPException:
+                pass
+
         except asyncio.CancelledError:
             pass
             
@@ -76,7 +207,17 @@ class PracticeQuestionView(discord.ui.View):
         """Handle timeout when user doesn't answer in time"""
         if self.answered:
             return
-            
+
+        # The session is over for this view - persist whatever deltas
+        # the checkpoint flush hasn't written yet
+        await self._flush_stats()
+
+        # Re-check after the await: a button click dispatched in the
+        # same tick as the view timeout can land while the flush is in
+        # flight, and its result edit must win over the timeout edit
+        if self.answered:
+            return
+
         # Disable all buttons
         for item in self.children:
             if hasattr(item, 'disabled'):
@@ -86,7 +227,7 @@ class PracticeQuestionView(discord.ui.View):
         timeout_embed = discord.Embed(
             title="⏰ Time's Up!",
             description=f"You didn't answer in time. The correct answer was **{self.correct_answer}**.",
-            color=0xff4444  # Red
+            color=self.COLOR_RED
         )
         
         timeout_embed.add_field(
@@ -98,73 +239,120 @@ class PracticeQuestionView(discord.ui.View):
         try:
             # Update the original message to show timeout
             if self.original_message:
+                await _throttle(self.original_message.channel.id)
                 await self.original_message.edit(embed=timeout_embed, view=self)
                 
-                # Show next question if available (after timeout)
-                if self.remaining_questions and self.interaction_context:
-                    await asyncio.sleep(3)  # Brief pause before next question
-                    await self.send_next_question_after_timeout()
+                # Show next question if available (after timeout) - the
+                # 3s pause runs on the loop's timer so this callback
+                # finishes right away
+                if self.question_number < self.total_questions and self.interaction_context:
+                    asyncio.get_running_loop().call_later(
+                        3.0, lambda: asyncio.create_task(
+                            self.send_next_question_after_timeout()))
                     
         except discord.NotFound:
             pass
         except discord.HTTPException:
             pass
     
-    async def send_next_question_after_timeout(self):
-        """Send next question after a timeout (different from normal flow)"""
-        if not self.remaining_questions:
-            return
-            
-        # Get next question data
-        next_question_data = self.remaining_questions.pop(0)
-        question_content = next_question_data['question']
-        correct_answer = next_question_data['answer'] 
-        explanation = next_question_data['explanation']
-        next_question_number = self.question_number + 1
-        
-        # Get user data from database for cert name
-        try:
-            user_data = await get_user_data(self.user_id)
-            cert_name = user_data.get('selected_cert', 'Unknown')
-        except:
-            cert_name = 'Unknown'
-        
-        # Create next question embed
-        question_embed = discord.Embed(
-            title=f"📝 Practice Question {next_question_number}/{self.total_questions} - {cert_name}",
-            description=question_content,
-            color=0x7289da
+    def _advance_to_next_question(self):
+        """Re-arm this view for the next question and return its entry.
+
+        The view lives for the whole session: advancing swaps in the
+        next entry's answer/explanation/text and re-enables the buttons
+        instead of allocating a fresh view (four buttons, a timeout
+        timer, component re-registration) per question. Each button
+        click already refreshes the view's timeout clock, so the reused
+        view still gives the full window per question.
+        """
+        entry = self.questions[self.question_number]
+        self.question_number += 1
+        self.correct_answer = entry.answer.upper()
+        self.explanation = entry.explanation
+        self.question_text = entry.question
+        self.question_topic = entry.topic
+        self.answered = False
+        self.original_message = None
+        self._alert_handle = None
+        self._alert_task = None
+        for item in self.children:
+            if hasattr(item, 'disabled'):
+                item.disabled = False
+        return entry
+
+    def _build_question_embed(self, entry, question_number):
+        """Build the embed for a question entry"""
+        # The certification is already held on the session view;
+        # no database read needed just for the embed title
+        cert_name = self.certification or 'Unknown'
+
+        # Start from the module template - color and footer are already
+        # in place, only the per-question parts get assigned
+        question_embed = copy.copy(_QUESTION_EMBED_TEMPLATE)
+        question_embed.title = f"Practice Question {question_number}/{self.total_questions}"
+        # Native <t:..:R> timestamp: every client renders "in 37 seconds"
+        # and ticks it down locally, so the countdown costs no REST
+        # traffic. (Timestamps don't render in footers, hence here.)
+        deadline = int(time.time()) + 60
+        question_embed.description = (
+            f"**{entry.question}**\n\n⏰ Ends <t:{deadline}:R>")
+
+        # Add certification badge
+        question_embed.set_author(
+            name=f"📚 {cert_name} Certification Practice"
         )
-        
-        # Add the multiple choice options to the embed
-        if 'options' in next_question_data:
-            options_text = ""
-            for letter, option in next_question_data['options'].items():
-                options_text += f"**{letter.upper()})** {option}\n"
+
+        # Options were pre-rendered into the entry at session start
+        if entry.options_text:
             question_embed.add_field(
-                name="Answer Choices",
-                value=options_text,
+                name="📝 Select your answer:",
+                value=entry.options_text,
                 inline=False
             )
-        
-        question_embed.set_footer(text="⏰ Time remaining: 60 seconds - Click a button to answer!")
-        
-        # Create new interactive view
+
+        # Add progress bar visual - ljust pads the unfilled tail in the
+        # same allocation instead of building two segment strings
+        progress_fill = ("█" * question_number).ljust(self.total_questions, "░")
+        progress_bar = f"```[{progress_fill}] {question_number}/{self.total_questions}```"
+
+        question_embed.add_field(
+            name="📊 Progress",
+            value=progress_bar,
+            inline=False
+        )
+
+        # Footer comes from the template
+        return question_embed
+
+    async def send_next_question_after_timeout(self):
+        """Send next question after a timeout (different from normal flow)"""
+        if self.question_number >= self.total_questions:
+            return
+
+        # A timed-out view is finished as far as discord.py is concerned
+        # and stops receiving interactions, so this cold path is the one
+        # place a successor view still gets allocated
+        entry = self.questions[self.question_number]
+        next_question_number = self.question_number + 1
         next_view = PracticeQuestionView(
-            correct_answer=correct_answer,
-            explanation=explanation,
+            correct_answer=entry.answer,
+            explanation=entry.explanation,
             user_id=self.user_id,
             question_number=next_question_number,
             total_questions=self.total_questions,
-            remaining_questions=self.remaining_questions,
+            questions=self.questions,
             interaction_context=self.interaction_context,
-            question_text=question_content,
-            certification=cert_name
+            question_text=entry.question,
+            certification=self.certification,
+            user_data=self.user_data,
+            question_topic=entry.topic
         )
-        
+        question_embed = next_view._build_question_embed(entry, next_question_number)
+
         try:
             # Send next question
             if self.interaction_context:
+                await _throttle(self.interaction_context.channel_id)
                 next_message = await self.interaction_context.followup.send(embed=question_embed, view=next_view)
                 await next_view.start_countdown(next_message)
         except discord.HTTPException:
@@ -172,6 +360,38 @@ class PracticeQuestionView(discord.ui.View):
         except AttributeError:
             pass
         
+    async def _update_adaptive(self, is_correct: bool):
+        """Record topic performance, off the hot path.
+
+        Questions generated with a topic tag skip the extraction AI
+        call entirely; extraction is only the fallback for untagged
+        content.
+        """
+        try:
+            topic = self.question_topic
+            if not topic:
+                topic = await extract_topic_from_question(self.question_text,
+                                                          self.certification)
+            await update_topic_performance(self.user_id, self.certification,
+                                           topic, is_correct, 30)
+        except Exception as e:
+            log.error("❌ Adaptive learning update failed: %s", e)
+
+    async def _flush_stats(self):
+        """Write accumulated answer deltas to the database.
+
+        Counters are read and reset before the await, so a checkpoint
+        flush racing a session-end flush can't apply a delta twice.
+        """
+        if not self._unflushed_answers:
+            return
+        correct = self._pending_correct
+        score = self._pending_score
+        self._pending_correct = 0
+        self._pending_score = 0
+        self._unflushed_answers = 0
+        await increment_user_stats(self.user_id, correct=correct, score=score)
+
     def check_answer(self, selected_answer: str) -> bool:
         """Check if the selected answer is correct"""
         return selected_answer.upper() == self.correct_answer
@@ -188,36 +408,62 @@ class PracticeQuestionView(discord.ui.View):
             
         self.answered = True
         is_correct = self.check_answer(selected_answer)
-        
-        # Cancel countdown timer
-        if self.countdown_task:
-            self.countdown_task.cancel()
-        
-        # Update user statistics - get from database
-        user_data = await get_user_data(self.user_id, str(interaction.user.name))
+
+        # Disarm the red-alert timer; if it already fired, drain the
+        # task so an in-flight edit can't race the result edit below
+        if self._alert_handle is not None:
+            self._alert_handle.cancel()
+        if self._alert_task is not None:
+            self._alert_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._alert_task
         
         if is_correct:
-            user_data["correct_answers"] += 1
-            user_data["study_score"] += 1
             score_change = "+1"
-            result_color = 0x00ff00  # Green
-            result_emoji = "✅"
+            result_color = self.COLOR_GREEN
+            result_emoji = self.EMOJI_CORRECT
             feedback_title = f"Correct! Great job! 🎉"
         else:
-            user_data["study_score"] -= 1
             score_change = "-1"
-            result_color = 0xff4444  # Red
-            result_emoji = "❌" 
+            result_color = self.COLOR_RED
+            result_emoji = self.EMOJI_WRONG
             feedback_title = f"Not quite right, but keep learning! 📚"
-        
-        # Save updated data to database
-        await update_user_data(self.user_id, user_data)
-        
-        # Extract topic from question for adaptive learning
+
+        # Accumulate the delta in memory instead of writing per answer;
+        # the delta UPDATE at flush time still can't lose concurrent
+        # increments. The cached record is advanced locally so the
+        # result embed shows the running score without a round-trip
+        self._pending_correct += 1 if is_correct else 0
+        self._pending_score += 1 if is_correct else -1
+        self._unflushed_answers += 1
+
+        if self.user_data is None:
+            self.user_data = await get_user_data(self.user_id,
+                                                 interaction.user.name)
+        if self.user_data is not None:
+            if is_correct:
+                self.user_data['correct_answers'] += 1
+            self.user_data['study_score'] += 1 if is_correct else -1
+        user_data = self.user_data
+
+        # Safety checkpoint so a long session never carries more than a
+        # few answers of unflushed state
+        if self._unflushed_answers >= 5:
+            asyncio.create_task(self._flush_stats())
+        
+        # Record the answer for history/leaderboards - enqueued and
+        # batch-inserted by the write-behind flusher in models.py
+        await record_answer(self.user_id, self.certification,
+                            self.question_text, selected_answer.upper(),
+                            self.correct_answer, is_correct)
+
+        # Adaptive learning runs as a background task: the topic
+        # extraction can be an OpenAI round-trip and nothing in the
+        # result embed depends on it, so the user shouldn't wait on it
         if self.question_text and self.certification:
-            topic = await extract_topic_from_question(self.question_text, self.certification)
-            await update_topic_performance(self.user_id, self.certification, topic, is_correct, 30)
-            
+            asyncio.create_task(self._update_adaptive(is_correct))
+
+
         # Disable all buttons
         for item in self.children:
             if hasattr(item, 'disabled'):
@@ -225,75 +471,72 @@ class PracticeQuestionView(discord.ui.View):
             
         # Get the original question embed to preserve it
         original_embed = self.original_message.embeds[0] if self.original_message.embeds else None
-        
-        # Create combined embed that shows BOTH question and result
-        combined_embed = discord.Embed(
-            title=f"Question {self.question_number}/{self.total_questions} • {self.certification or 'Practice'}",
-            description=f"**{self.question_text}**" if self.question_text else original_embed.description if original_embed else "",
-            color=result_color
-        )
-        
-        # Add original answer choices if available
-        if original_embed:
-            for field in original_embed.fields:
-                if "Answer Choices" in field.name or "Select your answer" in field.name:
-                    combined_embed.add_field(
-                        name="📝 Answer Choices",
-                        value=field.value,
-                        inline=False
-                    )
-        
-        # Add modern result section with visual hierarchy
-        result_header = f"{result_emoji} **{feedback_title}**"
-        
-        answer_comparison = f"```ansi\n"
-        if is_correct:
-            answer_comparison += f"\u001b[32m✅ Your Answer: {selected_answer.upper()}\u001b[0m\n"
-            answer_comparison += f"\u001b[32m🎯 Correct Answer: {self.correct_answer}\u001b[0m\n"
-        else:
-            answer_comparison += f"\u001b[31m❌ Your Answer: {selected_answer.upper()}\u001b[0m\n"
-            answer_comparison += f"\u001b[32m🎯 Correct Answer: {self.correct_answer}\u001b[0m\n"
-        answer_comparison += f"\u001b[36m📊 Score: {score_change} (Total: {user_data['study_score']})\u001b[0m\n```"
-        
-        combined_embed.add_field(
-            name=result_header,
-            value=answer_comparison,
-            inline=False
-        )
-        
-        # Add explanation with better formatting
-        explanation_text = f"💡 **Explanation:**\n{self.explanation}"
-        combined_embed.add_field(
-            name="\u200b",  # Invisible character for spacing
-            value=explanation_text,
-            inline=False
-        )
-        
-        # Add completion status
-        combined_embed.set_footer(
-            text=f"Question {self.question_number}/{self.total_questions} completed • {len(self.remaining_questions)} remaining"
-        )
+
+        answer_comparison = (_CORRECT_TPL if is_correct else _WRONG_TPL) % (
+            selected_answer.upper(), self.correct_answer, score_change,
+            user_data['study_score'])
+
+        # Assemble the whole question+result embed as one payload dict
+        # and hydrate it in a single from_dict call instead of growing
+        # the field list add_field by add_field
+        fields = [
+            # Carry the original answer choices forward if available
+            {"name": "📝 Answer Choices", "value": field.value, "inline": False}
+            for field in (original_embed.fields if original_embed else ())
+            if "Answer Choices" in field.name or "Select your answer" in field.name
+        ]
+        fields.append({
+            "name": f"{result_emoji} **{feedback_title}**",
+            "value": answer_comparison,
+            "inline": False,
+        })
+        fields.append({
+            "name": "\u200b",  # Invisible character for spacing
+            "value": f"💡 **Explanation:**\n{self.explanation}",
+            "inline": False,
+        })
+        combined_embed = discord.Embed.from_dict({
+            "title": f"Question {self.question_number}/{self.total_questions} • {self.certification or 'Practice'}",
+            "description": f"**{self.question_text}**" if self.question_text else original_embed.description if original_embed else "",
+            "color": result_color,
+            "fields": fields,
+            "footer": {
+                "text": f"Question {self.question_number}/{self.total_questions} completed • {self.total_questions - self.question_number} remaining"
+            },
+        })
         
         # Update message with combined question + result
         await interaction.response.edit_message(embed=combined_embed, view=self)
-        print(f"📝 {interaction.user.name} answered {selected_answer} - {'✅ Correct' if is_correct else '❌ Wrong'} (Score: {user_data['study_score']})")
-        
-        # Brief pause before showing next question
-        await asyncio.sleep(2)
-        await self.send_next_question(interaction)
+        log.info("📝 %s answered %s - %s (Score: %s)",
+                 interaction.user.name, selected_answer,
+                 "✅ Correct" if is_correct else "❌ Wrong",
+                 user_data['study_score'])
+        
+        # Schedule the next question instead of sleeping here - the
+        # handler returns immediately and the loop's timer fires the
+        # send after the same 2s reading pause
+        asyncio.get_running_loop().call_later(
+            2.0, lambda: asyncio.create_task(self.send_next_question(interaction)))
 
     async def send_next_question(self, interaction: discord.Interaction):
         """Send the next question in the sequence"""
-        if not self.remaining_questions:
+        if self.question_number >= self.total_questions:
+            # Session complete - persist any remaining answer deltas
+            await self._flush_stats()
+
             # No more questions - show completion message
             completion_embed = discord.Embed(
                 title="🎉 Practice Session Complete!",
                 description=f"Great job! You completed all {self.total_questions} questions.",
-                color=0x00ff00
+                color=self.COLOR_GREEN
             )
             
             try:
-                user_data = await get_user_data(self.user_id)
+                # The cached record already reflects this session's
+                # answers; only a cache-less view re-reads the database
+                user_data = self.user_data
+                if user_data is None:
+                    user_data = await get_user_data(self.user_id)
                 if user_data['total_questions'] > 0:
                     accuracy = (user_data['correct_answers']/user_data['total_questions']*100)
                 else:
@@ -303,7 +546,10 @@ class PracticeQuestionView(discord.ui.View):
                     value=f"Score: {user_data['study_score']} | Total Questions: {user_data['total_questions']} | Accuracy: {accuracy:.1f}%",
                     inline=False
                 )
-            except:
+            except (KeyError, TypeError, ZeroDivisionError) as e:
+                # Bare except here used to swallow CancelledError and
+                # keep a cancelled session task alive as a zombie
+                log.warning("⚠️ Session summary unavailable: %s", e)
                 completion_embed.add_field(
                     name="📊 Session Summary",
                     value="Great work completing the questions!",
@@ -315,91 +561,41 @@ class PracticeQuestionView(discord.ui.View):
                 inline=False
             )
             
+            await _throttle(interaction.channel_id)
             await interaction.followup.send(embed=completion_embed)
+            self.stop()
             return
-        
-        # Get next question data
-        next_question_data = self.remaining_questions.pop(0)
-        question_content = next_question_data['question']
-        correct_answer = next_question_data['answer'] 
-        explanation = next_question_data['explanation']
-        next_question_number = self.question_number + 1
-        
-        # Get user data from database for cert name
-        try:
-            user_data = await get_user_data(self.user_id)
-            cert_name = user_data.get('selected_cert', 'Unknown')
-        except:
-            cert_name = 'Unknown'
-            
-        # Create modern, professional question embed
-        question_embed = discord.Embed(
-            title=f"Practice Question {next_question_number}/{self.total_questions}",
-            description=f"**{question_content}**",
-            color=0x2B2D31  # Professional dark theme
-        )
-        
-        # Add certification badge
-        question_embed.set_author(
-            name=f"📚 {cert_name} Certification Practice"
-        )
-        
-        # Add the multiple choice options with modern styling
-        if 'options' in next_question_data:
-            options_text = "```\n"
-            for letter, option in next_question_data['options'].items():
-                options_text += f"{letter.upper()})  {option}\n"
-            options_text += "```"
-            question_embed.add_field(
-                name="📝 Select your answer:",
-                value=options_text,
-                inline=False
-            )
-        
-        # Add progress bar visual
-        progress_filled = "█" * next_question_number
-        progress_empty = "░" * (self.total_questions - next_question_number)
-        progress_bar = f"```[{progress_filled}{progress_empty}] {next_question_number}/{self.total_questions}```"
-        
-        question_embed.add_field(
-            name="📊 Progress",
-            value=progress_bar,
-            inline=False
-        )
-        
-        question_embed.set_footer(
-            text="⏰ 60 seconds to answer • Choose A, B, C, or D below"
-        )
-        
-        # Create new interactive view
-        next_view = PracticeQuestionView(
-            correct_answer=correct_answer,
-            explanation=explanation,
-            user_id=self.user_id,
-            question_number=next_question_number,
-            total_questions=self.total_questions,
-            remaining_questions=self.remaining_questions,
-            interaction_context=self.interaction_context,
-            question_text=question_content,
-            certification=cert_name
-        )
-        
+
+        # Re-arm this same view for the next question - the session
+        # keeps one live view instead of a chain of discarded ones
+        entry = self._advance_to_next_question()
+        question_embed = self._build_question_embed(entry, self.question_number)
+
         # Send next question
-        next_message = await interaction.followup.send(embed=question_embed, view=next_view)
-        await next_view.start_countdown(next_message)
+        await _throttle(interaction.channel_id)
+        next_message = await interaction.followup.send(embed=question_embed, view=self)
+        await self.start_countdown(next_message)
 
-    @discord.ui.button(label='A', style=discord.ButtonStyle.primary, emoji='🅰️')
-    async def answer_a(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self.handle_answer(interaction, 'A')
-        
-    @discord.ui.button(label='B', style=discord.ButtonStyle.primary, emoji='🅱️') 
-    async def answer_b(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self.handle_answer(interaction, 'B')
-        
-    @discord.ui.button(label='C', style=discord.ButtonStyle.primary, emoji='🔴')
-    async def answer_c(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self.handle_answer(interaction, 'C')
-        
-    @discord.ui.button(label='D', style=discord.ButtonStyle.primary, emoji='🔵')
-    async def answer_d(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self.handle_answer(interaction, 'D')
\ No newline at end of file
+    async def _on_answer_button(self, interaction: discord.Interaction, label: str):
+        """Shared callback for all four answer buttons"""
+        await self.handle_answer(interaction, label)
+
+# Answer-comparison blocks differ only in their values, so two
+# %-templates replace the per-answer chain of ANSI f-string
+# concatenations; the right one is picked by the correctness branch
+_CORRECT_TPL = ("```ansi\n"
+                "\u001b[32m✅ Your Answer: %s\u001b[0m\n"
+                "\u001b[32m🎯 Correct Answer: %s\u001b[0m\n"
+                "\u001b[36m📊 Score: %s (Total: %s)\u001b[0m\n```")
+_WRONG_TPL = ("```ansi\n"
+              "\u001b[31m❌ Your Answer: %s\u001b[0m\n"
+              "\u001b[32m🎯 Correct Answer: %s\u001b[0m\n"
+              "\u001b[36m📊 Score: %s (Total: %s)\u001b[0m\n```")
+
+# Shared skeleton for per-question embeds. The color and footer never
+# change within a session, so each question shallow-copies this instead
+# of building a fresh Embed; the template carries no fields, so
+# add_field on a copy creates the copy's own field list
+_QUESTION_EMBED_TEMPLATE = discord.Embed(color=PracticeQuestionView.COLOR_THEME)
+_QUESTION_EMBED_TEMPLATE.set_footer(
+    text="⏰ 60 seconds to answer • Choose A, B, C, or D below")
\ No newline at end of file
@@ -1,4 +1,21 @@
 """Utility functions and helpers"""
+import re
+from bisect import bisect_right
+
+# Matches a leading ```json / ``` fence and the trailing ``` fence that
+# AI responses often wrap around JSON payloads
+_FENCE_RE = re.compile(r"\A```(?:json)?\n?|\n?```\Z")
+
+def strip_json_fences(text):
+    """Strip Markdown code fences from an AI response in one regex pass"""
+    return _FENCE_RE.sub("", text).strip()
+
+# Sorted cutoffs and their bands, shared by the bisect lookups below:
+# progress-bar color by fill percentage and skill tier by study score
+_BAR_COLOR_CUTOFFS = (0.6, 0.8)
+_BAR_COLORS = ("🟥", "🟨", "🟩")  # Needs improvement / good / excellent
+_TIER_THRESH = (25, 50, 100)
+_TIERS = ("ADVANCED", "EXPERT", "LEGEND")
 
 def create_progress_bar(value, max_value, length=16):
     """Create a modern progress bar visualization"""
@@ -8,35 +25,37 @@ def create_progress_bar(value, max_value, length=16):
         percentage = min(value / max_value, 1.0)  # Cap at 100%
     
     filled = int(length * percentage)
-    empty = length - filled
-    
-    # Use different colors based on percentage
-    if percentage >= 0.8:
-        bar_char = "🟩"  # Green for excellent
-    elif percentage >= 0.6:
-        bar_char = "🟨"  # Yellow for good
-    else:
-        bar_char = "🟥"  # Red for needs improvement
-    
-    bar = bar_char * filled + "⬜" * empty
+
+    # Color by percentage band: red / yellow / green, picked with one
+    # bisect over the sorted cutoffs instead of an if/elif chain
+    bar_char = _BAR_COLORS[bisect_right(_BAR_COLOR_CUTOFFS, percentage)]
+
+    # ljust pads the empty tail in the same allocation, and a full bar
+    # never allocates an empty-segment string at all
+    bar = (bar_char * filled).ljust(length, "⬜")
     return f"{bar} **{percentage*100:.1f}%**"
 
 def create_clean_stats_table(data_rows):
     """Create a clean, aligned stats table"""
     if not data_rows:
         return "```\nNo data available\n```"
-    
-    # Find max widths for alignment
-    max_name_width = max(len(row[0]) for row in data_rows)
-    max_acc_width = max(len(f"{row[1]:.1f}%") for row in data_rows)
-    
-    table = "```\n"
-    for name, accuracy, questions in data_rows:
-        name_padded = name[:24].ljust(min(24, max_name_width))
-        acc_padded = f"{accuracy:.1f}%".rjust(max_acc_width)
-        table += f"{name_padded}  {acc_padded}  {questions:>3} questions\n"
-    table += "```"
-    return table
+
+    # Format each accuracy once up front; the width scan and the row
+    # build both reuse the cached strings instead of re-formatting
+    formatted = [(name, f"{accuracy:.1f}%", questions)
+                 for name, accuracy, questions in data_rows]
+    max_name_width = max(len(name) for name, _, _ in formatted)
+    max_acc_width = max(len(acc) for _, acc, _ in formatted)
+
+    # Build rows into a list and join once - guaranteed O(n), where
+    # repeated string += depends on a CPython refcount optimization
+    name_width = min(24, max_name_width)
+    rows = ["```\n"]
+    rows.extend(
+        f"{name[:24].ljust(name_width)}  {acc.rjust(max_acc_width)}  {questions:>3} questions\n"
+        for name, acc, questions in formatted)
+    rows.append("```")
+    return "".join(rows)
 
 def get_rank_display(position):
     """Get clean rank display for leaderboard position"""
@@ -44,13 +63,7 @@ def get_rank_display(position):
 
 def get_skill_tier(score, questions):
     """Get skill tier based on performance"""
-    if score >= 100:
-        return "LEGEND"
-    elif score >= 50:
-        return "EXPERT" 
-    elif score >= 25:
-        return "ADVANCED"
-    elif questions >= 20:
-        return "INTERMEDIATE"
-    else:
-        return "BEGINNER"
\ No newline at end of file
+    idx = bisect_right(_TIER_THRESH, score)
+    if idx:
+        return _TIERS[idx - 1]
+    return "INTERMEDIATE" if questions >= 20 else "BEGINNER"
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""Buffered logging shared across modules.
+
+print() acquires the stdout lock on the calling (event-loop) thread;
+routing records through a QueueHandler moves formatting and I/O onto a
+single background listener thread, so hot paths only enqueue a record.
+"""
+import logging
+import logging.handlers
+import queue
+import sys
+
+_listener = None
+
+def get_logger(name):
+    """Get a logger backed by the shared background queue listener"""
+    global _listener
+    if _listener is None:
+        log_queue = queue.SimpleQueue()
+        root = logging.getLogger()
+        root.setLevel(logging.INFO)
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        stream = logging.StreamHandler(sys.stdout)
+        stream.setFormatter(logging.Formatter("%(message)s"))
+        _listener = logging.handlers.QueueListener(log_queue, stream)
+        _listener.start()
+    return logging.getLogger(name)